@@ -35,6 +35,8 @@ contract ReputationDAO {
     Proposal[] public proposals;
     uint public proposalCount;
     uint public totalMembers;
+    mapping(uint => bool) public pruneStarted;    // Per-voter data partly or fully cleared
+    mapping(uint => bool) public proposalPruned;  // Per-voter data cleared, only summary kept
     
     uint public constant REWARD_AMOUNT = 10;
     uint public constant VOTE_THRESHOLD = 3;
@@ -43,9 +45,10 @@ contract ReputationDAO {
     event MemberRoleChanged(address member, Role newRole);
     event MemberRemoved(address member);
     event ProposalCreated(uint id, string url, address proposer);
-    event Voted(uint proposalId, address voter, uint8 option);
+    event Voted(uint indexed proposalId, address voter, uint8 option);
     event ProposalProcessed(uint id, Reputation status);
     event ProposalDeactivated(uint id);
+    event ProposalPruned(uint id, uint votersCleared, bool complete);
 
     modifier onlyMember() {
         require(members[msg.sender].isMember, "Not a member");
@@ -92,6 +95,18 @@ contract ReputationDAO {
     }
 
     function submitWebsite(string calldata _url) external onlyMember {
+        _createProposal(_url);
+    }
+
+    // Batch entry point for bulk imports: one transaction creates a proposal per URL
+    function submitWebsites(string[] calldata _urls) external onlyMember {
+        require(_urls.length > 0, "No URLs provided");
+        for (uint i = 0; i < _urls.length; i++) {
+            _createProposal(_urls[i]);
+        }
+    }
+
+    function _createProposal(string calldata _url) internal {
         Proposal storage newProposal = proposals.push();
         newProposal.id = proposalCount;
         newProposal.websiteUrl = _url;
@@ -160,6 +175,34 @@ contract ReputationDAO {
         
         emit ProposalProcessed(_proposalId, p.finalStatus);
     }
+
+    // Clears per-voter storage of a finalized proposal (rewards are already paid out
+    // in processProposal). At most _maxVoters entries are cleared per call so large
+    // proposals can be compacted over several transactions. Vote counts and the final
+    // status stay on-chain; individual ballots remain available from Voted events.
+    function pruneProposal(uint _proposalId, uint _maxVoters) external {
+        require(_proposalId < proposalCount, "Invalid proposal ID");
+        require(_maxVoters > 0, "Batch size must be positive");
+        Proposal storage p = proposals[_proposalId];
+        require(p.processed, "Proposal not processed");
+        require(!proposalPruned[_proposalId], "Already pruned");
+
+        pruneStarted[_proposalId] = true;
+        uint cleared = 0;
+        while (p.voters.length > 0 && cleared < _maxVoters) {
+            address voter = p.voters[p.voters.length - 1];
+            delete p.voterChoice[voter];
+            delete members[voter].hasVoted[_proposalId];
+            p.voters.pop();
+            cleared++;
+        }
+
+        bool complete = p.voters.length == 0;
+        if (complete) {
+            proposalPruned[_proposalId] = true;
+        }
+        emit ProposalPruned(_proposalId, cleared, complete);
+    }
     
     // Admin Functions
     function setMemberRole(address _member, Role _role) external onlyAdmin {
@@ -231,12 +274,14 @@ contract ReputationDAO {
 
     function getVoterChoice(uint _proposalId, address _voter) external view returns (uint8) {
         require(_proposalId < proposalCount, "Invalid proposal ID");
+        require(!pruneStarted[_proposalId], "Proposal pruned, read Voted events");
         require(members[_voter].hasVoted[_proposalId], "Voter has not voted on this proposal");
         return proposals[_proposalId].voterChoice[_voter];
     }
 
     function getProposalVoters(uint _proposalId) external view returns (address[] memory) {
         require(_proposalId < proposalCount, "Invalid proposal ID");
+        require(!pruneStarted[_proposalId], "Proposal pruned, read Voted events");
         return proposals[_proposalId].voters;
     }
 }
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Vote Analytics
+Loads proposals and ballots into columnar NumPy arrays and computes
+per-member majority agreement, pairwise voter agreement and blocs of
+suspiciously correlated voters.
+
+Members and proposals get compact integer ids (row/column indices). Ballots
+are kept as three parallel arrays sorted by proposal, so voter x proposal
+choice blocks can be built on demand instead of materializing the full
+matrix; pairwise agreement is accumulated block by block with matrix
+products written into preallocated buffers. For 10k members peak memory is
+about 1 GB regardless of the number of proposals: two 10k x 10k float32
+accumulators (800 MB) plus a row-stripe scratch buffer and the per-block
+working arrays (about 200 MB at the default block size).
+
+Majority agreement uses the on-chain outcome (finalStatus from
+ProposalProcessed events); ballots on proposals that were never finalized
+are left out.
+
+Usage:
+    python scripts/analytics.py [--threshold 0.95] [--min-overlap 20]
+"""
+import argparse
+from array import array
+
+import numpy as np
+
+NUM_OPTIONS = 4  # Scam, HighRisk, Normal, Safe
+NO_VOTE = -1
+
+
+class VoteData:
+    """Columnar ballots: voter_idx[k] voted choice[k] on proposal_idx[k]."""
+
+    def __init__(self, members, voter_idx, proposal_idx, choice, num_proposals, outcomes=None):
+        order = np.argsort(proposal_idx, kind="stable")
+        self.members = list(members)  # compact member id -> address
+        self.voter_idx = np.asarray(voter_idx, dtype=np.int32)[order]
+        self.proposal_idx = np.asarray(proposal_idx, dtype=np.int32)[order]
+        self.choice = np.asarray(choice, dtype=np.int8)[order]
+        self.num_members = len(self.members)
+        self.num_proposals = num_proposals
+
+        # Final status per proposal, NO_VOTE while not finalized
+        self.final_status = np.full(num_proposals, NO_VOTE, dtype=np.int8)
+        for proposal_id, status in (outcomes or {}).items():
+            self.final_status[proposal_id] = status
+
+    @classmethod
+    def from_ballots(cls, ballots, num_proposals=None, outcomes=None):
+        """Build from an iterable of (proposal_id, voter_address, option).
+
+        outcomes maps finalized proposal ids to their final status.
+        """
+        # Typed arrays keep the columns at 4 + 4 + 1 bytes per ballot while loading
+        member_ids = {}
+        voters, proposals, choices = array("i"), array("i"), array("b")
+        for proposal_id, voter, option in ballots:
+            voters.append(member_ids.setdefault(voter, len(member_ids)))
+            proposals.append(proposal_id)
+            choices.append(option)
+
+        voter_idx = np.frombuffer(voters, dtype=np.intc)
+        proposal_idx = np.frombuffer(proposals, dtype=np.intc)
+        choice = np.frombuffer(choices, dtype=np.int8)
+        if num_proposals is None:
+            num_proposals = int(proposal_idx.max()) + 1 if len(proposal_idx) else 0
+        return cls(member_ids, voter_idx, proposal_idx, choice, num_proposals, outcomes)
+
+    @classmethod
+    def from_client(cls, client, from_block=0):
+        """Load ballots from Voted events (available even for pruned proposals)
+        and outcomes from ProposalProcessed events."""
+        outcomes = {log.args.id: log.args.status for log in client.iter_logs("ProposalProcessed", from_block)}
+        ballots = (
+            (log.args.proposalId, log.args.voter, log.args.option)
+            for log in client.iter_logs("Voted", from_block)
+        )
+        num_proposals = client.contract.functions.proposalCount().call()
+        return cls.from_ballots(ballots, num_proposals, outcomes)
+
+    def choice_block(self, start, stop):
+        """Voter x proposal int8 choices for proposals [start, stop), NO_VOTE where absent."""
+        lo, hi = np.searchsorted(self.proposal_idx, [start, stop])
+        block = np.full((self.num_members, stop - start), NO_VOTE, dtype=np.int8)
+        block[self.voter_idx[lo:hi], self.proposal_idx[lo:hi] - start] = self.choice[lo:hi]
+        return block
+
+    def choice_matrix(self):
+        """Full voter x proposal int8 choice matrix (num_members * num_proposals bytes)."""
+        return self.choice_block(0, self.num_proposals)
+
+    def majority_agreement(self):
+        """Fraction of each member's ballots on finalized proposals that matched
+        the final status (NaN if the member has none)."""
+        outcome = self.final_status[self.proposal_idx]
+        finalized = outcome != NO_VOTE
+        voters = self.voter_idx[finalized]
+        agreed = outcome[finalized] == self.choice[finalized]
+        cast = np.bincount(voters, minlength=self.num_members)
+        hits = np.bincount(voters, weights=agreed, minlength=self.num_members)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return hits / cast
+
+    def pairwise_agreement(self, block_size=2048, stripe_rows=1024):
+        """Return (agreement, overlap) member x member matrices.
+
+        overlap[i, j] counts proposals both members voted on; agreement[i, j]
+        is the fraction of those where they chose the same option (NaN if
+        they never overlapped).
+        """
+        n = self.num_members
+        agree = np.zeros((n, n), dtype=np.float32)
+        overlap = np.zeros((n, n), dtype=np.float32)
+        if n == 0:
+            return agree, overlap
+        stripe_rows = max(1, min(stripe_rows, n))
+        scratch = np.empty(stripe_rows * n, dtype=np.float32)
+        voted = np.empty((n, block_size), dtype=np.float32)
+        picked = np.empty((n, block_size), dtype=np.float32)
+
+        for start in range(0, self.num_proposals, block_size):
+            stop = min(start + block_size, self.num_proposals)
+            block = self.choice_block(start, stop)
+            width = stop - start
+            np.not_equal(block, NO_VOTE, out=voted[:, :width], casting="unsafe")
+            _accumulate_gram(overlap, voted[:, :width], scratch)
+            for option in range(NUM_OPTIONS):
+                np.equal(block, option, out=picked[:, :width], casting="unsafe")
+                _accumulate_gram(agree, picked[:, :width], scratch)
+
+        _mirror_upper(agree, stripe_rows)
+        _mirror_upper(overlap, stripe_rows)
+
+        # No overlap means no agreement either, so 0 / 0 leaves NaN there
+        with np.errstate(invalid="ignore"):
+            np.divide(agree, overlap, out=agree)
+        return agree, overlap
+
+    def collusion_blocs(self, threshold=0.95, min_overlap=20, block_size=2048, stripe_rows=1024):
+        """Groups of members linked by agreement >= threshold over >= min_overlap shared proposals.
+
+        Returns a list of member index arrays, largest bloc first.
+        """
+        agree, overlap = self.pairwise_agreement(block_size, stripe_rows)
+
+        # Collect upper-triangle edges stripe by stripe to avoid n x n masks
+        n = self.num_members
+        columns = np.arange(n)
+        left, right = [], []
+        for r0 in range(0, n, stripe_rows):
+            r1 = min(r0 + stripe_rows, n)
+            linked = overlap[r0:r1] >= min_overlap
+            linked &= agree[r0:r1] >= threshold
+            linked &= columns > np.arange(r0, r1)[:, None]
+            rows, cols = np.nonzero(linked)
+            left.append(rows + r0)
+            right.append(cols)
+        del agree, overlap
+        left = np.concatenate(left) if left else np.empty(0, dtype=np.int64)
+        right = np.concatenate(right) if right else np.empty(0, dtype=np.int64)
+
+        labels = _connected_components(self.num_members, left, right)
+        in_bloc = np.zeros(self.num_members, dtype=bool)
+        in_bloc[left] = True
+        in_bloc[right] = True
+
+        members = np.flatnonzero(in_bloc)
+        order = np.argsort(labels[members], kind="stable")
+        members = members[order]
+        _, starts = np.unique(labels[members], return_index=True)
+        blocs = np.split(members, starts[1:]) if len(members) else []
+        return sorted(blocs, key=len, reverse=True)
+
+
+def _accumulate_gram(total, rows, scratch):
+    """Upper triangle of total += rows @ rows.T, one row stripe at a time.
+
+    Each stripe only multiplies against the rows at or below it, which halves
+    the work like a symmetric rank-k update; _mirror_upper fills the rest.
+    """
+    n = rows.shape[0]
+    stripe = scratch.size // n
+    for r0 in range(0, n, stripe):
+        r1 = min(r0 + stripe, n)
+        out = scratch[:(r1 - r0) * (n - r0)].reshape(r1 - r0, n - r0)
+        np.matmul(rows[r0:r1], rows[r0:].T, out=out)
+        total[r0:r1, r0:] += out
+
+
+def _mirror_upper(total, stripe):
+    """Copy the upper triangle onto the lower one in place."""
+    n = total.shape[0]
+    for r0 in range(stripe, n, stripe):
+        r1 = min(r0 + stripe, n)
+        total[r0:r1, :r0] = total[:r0, r0:r1].T
+
+
+def _connected_components(n, left, right):
+    """Label propagation with pointer jumping; every component gets its smallest index."""
+    labels = np.arange(n)
+    while True:
+        low = np.minimum(labels[left], labels[right])
+        updated = labels.copy()
+        np.minimum.at(updated, left, low)
+        np.minimum.at(updated, right, low)
+        updated = updated[updated]
+        if np.array_equal(updated, labels):
+            return labels
+        labels = updated
+
+
+def main():
+    from interact import DAOClient
+
+    parser = argparse.ArgumentParser(description="Analyze DAO voting patterns")
+    parser.add_argument("--threshold", type=float, default=0.95, help="Agreement ratio that links two voters")
+    parser.add_argument("--min-overlap", type=int, default=20, help="Minimum shared proposals for a link")
+    args = parser.parse_args()
+
+    data = VoteData.from_client(DAOClient())
+    print(f"Loaded {len(data.choice)} ballots from {data.num_members} members on {data.num_proposals} proposals")
+
+    agreement = data.majority_agreement()
+    print("\n--- Majority Agreement ---")
+    for idx in np.argsort(np.nan_to_num(agreement, nan=-1.0)):
+        if not np.isnan(agreement[idx]):
+            print(f"  {data.members[idx]}: {agreement[idx]:.1%}")
+
+    print("\n--- Suspicious Voting Blocs ---")
+    blocs = data.collusion_blocs(args.threshold, args.min_overlap)
+    if not blocs:
+        print("  None found")
+    for i, bloc in enumerate(blocs):
+        print(f"  Bloc {i + 1} ({len(bloc)} members): {', '.join(data.members[m] for m in bloc)}")
+
+
+if __name__ == "__main__":
+    main()
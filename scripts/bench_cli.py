@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+CLI Latency Benchmark
+Compares a one-off query (proposalCount) run three ways:
+  - cold:      new process importing web3, loading the ABI and building DAOClient
+  - warm CLI:  new process running dao_cli.py against the daemon
+  - warm call: request sent over the socket from this process (round trip only)
+Starts its own daemon on a temporary socket. Requires Ganache and a deployed contract.
+
+Usage:
+    python scripts/bench_cli.py [iterations]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from dao_cli import send_request
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+COLD_SNIPPET = (
+    "import sys; sys.path.insert(0, {!r}); from interact import DAOClient; "
+    "print(DAOClient().contract.functions.proposalCount().call())"
+).format(SCRIPTS_DIR)
+
+
+def timed(fn, iterations):
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def report(name, samples):
+    samples = sorted(samples)
+    p90 = samples[min(len(samples) - 1, int(len(samples) * 0.9))]
+    print(f"  {name:<10} median {statistics.median(samples):8.2f} ms   p90 {p90:8.2f} ms")
+
+
+def wait_for_daemon(socket_path, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            return send_request({"method": "ping"}, socket_path)
+        except (FileNotFoundError, ConnectionRefusedError):
+            time.sleep(0.1)
+    raise Exception("Daemon did not start")
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    socket_path = os.path.join(tempfile.mkdtemp(), "dao-bench.sock")
+    env = dict(os.environ, DAO_DAEMON_SOCKET=socket_path)
+    request = {"method": "call", "function": "proposalCount", "args": []}
+
+    daemon = subprocess.Popen([sys.executable, os.path.join(SCRIPTS_DIR, "daemon.py"), "--socket", socket_path])
+    try:
+        wait_for_daemon(socket_path)
+
+        cold = timed(lambda: subprocess.run([sys.executable, "-c", COLD_SNIPPET], check=True, capture_output=True), iterations)
+        warm_cli = timed(lambda: subprocess.run(
+            [sys.executable, os.path.join(SCRIPTS_DIR, "dao_cli.py"), "call", "proposalCount"],
+            check=True, capture_output=True, env=env,
+        ), iterations)
+        warm_call = timed(lambda: send_request(request, socket_path), iterations)
+
+        print(f"proposalCount latency over {iterations} runs:")
+        report("cold", cold)
+        report("warm CLI", warm_cli)
+        report("warm call", warm_call)
+    finally:
+        try:
+            send_request({"method": "shutdown"}, socket_path)
+        except OSError:
+            daemon.terminate()
+        daemon.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Warm DAO Client Daemon
+Keeps a connected DAOClient (web3 imported, ABI parsed, contract built) in a
+long-lived process and serves requests from scripts/dao_cli.py over a Unix
+socket. The client is rebuilt when contract_data.json changes, e.g. after
+deploy.py or reset_data.py.
+
+Protocol: one JSON object per line in each direction.
+    {"method": "call", "function": "proposals", "args": [0]}
+    {"ok": true, "result": [0, "http://...", ...]}
+
+Usage:
+    python scripts/daemon.py [--socket PATH]
+"""
+import argparse
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+
+from dao_cli import DEFAULT_SOCKET
+from interact import DAOClient
+
+CONTRACT_DATA = "contract_data.json"
+
+
+def to_json(value):
+    """Convert web3 return values (tuples, bytes, AttributeDicts) to JSON types."""
+    if isinstance(value, (list, tuple)):
+        return [to_json(v) for v in value]
+    if isinstance(value, (bytes, bytearray)):
+        return "0x" + bytes(value).hex()
+    if hasattr(value, "items"):
+        return {k: to_json(v) for k, v in value.items()}
+    return value
+
+
+class DAORequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            try:
+                result = self.server.dispatch(json.loads(line))
+                response = {"ok": True, "result": to_json(result)}
+            except Exception as e:
+                response = {"ok": False, "error": str(e)}
+            self.wfile.write((json.dumps(response) + "\n").encode("utf-8"))
+
+
+class DAODaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path):
+        self.client = None
+        self.data_mtime = None
+        self.client_lock = threading.Lock()
+        super().__init__(socket_path, DAORequestHandler)
+
+    def get_client(self):
+        mtime = os.path.getmtime(CONTRACT_DATA)
+        with self.client_lock:
+            if self.client is None or mtime != self.data_mtime:
+                self.client = DAOClient()
+                self.data_mtime = mtime
+            return self.client
+
+    def dispatch(self, request):
+        method = request["method"]
+        if method == "shutdown":
+            threading.Thread(target=self.shutdown).start()
+            return "Daemon stopping"
+
+        client = self.get_client()
+        if method == "ping":
+            return {"address": client.contract_address, "block": client.w3.eth.block_number}
+        if method == "accounts":
+            return list(client.accounts)
+        if method == "call":
+            fn = getattr(client.contract.functions, request["function"])
+            return fn(*request.get("args", [])).call()
+        if method == "transact":
+            account = client.accounts[request["account"]]
+            fn = getattr(client.contract.functions, request["function"])
+            tx_hash = fn(*request.get("args", [])).transact({"from": account})
+            receipt = client.w3.eth.wait_for_transaction_receipt(tx_hash)
+            return {"transactionHash": tx_hash, "status": receipt.status, "gasUsed": receipt.gasUsed}
+        raise ValueError(f"Unknown method: {method}")
+
+
+def remove_stale_socket(socket_path):
+    if not os.path.exists(socket_path):
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except ConnectionRefusedError:
+            os.unlink(socket_path)
+            return
+    raise Exception(f"A daemon is already listening on {socket_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a warm DAOClient over a Unix socket")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET, help="Unix socket path")
+    args = parser.parse_args()
+
+    try:
+        remove_stale_socket(args.socket)
+        server = DAODaemon(args.socket)
+        server.get_client()  # Warm up before accepting requests
+    except Exception as e:
+        print(f"Error starting daemon: {e}")
+        sys.exit(1)
+
+    print(f"DAO client daemon listening on {args.socket}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.unlink(args.socket)
+        print("Daemon stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Thin DAO CLI
+Forwards commands to the warm client daemon (scripts/daemon.py) over a Unix
+socket. Only standard library modules are imported so each invocation skips
+the web3 import, connection and ABI parsing that a cold DAOClient pays for.
+
+Usage:
+    python scripts/dao_cli.py ping
+    python scripts/dao_cli.py accounts
+    python scripts/dao_cli.py call proposals 0
+    python scripts/dao_cli.py call getMemberInfo 0x5EF08b21aF79953d9CAb48857a1Ae88bA68E5110
+    python scripts/dao_cli.py transact 1 vote 0 2
+    python scripts/dao_cli.py transact 0 submitWebsites '["http://a.com", "http://b.com"]'
+    python scripts/dao_cli.py shutdown
+"""
+import json
+import os
+import socket
+import sys
+import tempfile
+
+DEFAULT_SOCKET = os.environ.get("DAO_DAEMON_SOCKET", os.path.join(tempfile.gettempdir(), "dao-client.sock"))
+
+
+def send_request(request, socket_path=DEFAULT_SOCKET):
+    """Send one JSON request to the daemon and return its decoded response."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        with sock.makefile("rb") as f:
+            line = f.readline()
+    if not line:
+        raise Exception("Daemon closed the connection")
+    return json.loads(line)
+
+
+def parse_arg(arg):
+    # Numbers, booleans and lists arrive as JSON; anything else (URLs, addresses) as a string
+    try:
+        return json.loads(arg)
+    except ValueError:
+        return arg
+
+
+def build_request(argv):
+    command = argv[0]
+    if command in ("ping", "accounts", "shutdown"):
+        return {"method": command}
+    if command == "call" and len(argv) >= 2:
+        return {"method": "call", "function": argv[1], "args": [parse_arg(a) for a in argv[2:]]}
+    if command == "transact" and len(argv) >= 3:
+        return {
+            "method": "transact",
+            "account": int(argv[1]),
+            "function": argv[2],
+            "args": [parse_arg(a) for a in argv[3:]],
+        }
+    raise ValueError(f"Invalid command: {' '.join(argv)}")
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__.strip())
+        sys.exit(1)
+
+    try:
+        request = build_request(sys.argv[1:])
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    try:
+        response = send_request(request)
+    except (FileNotFoundError, ConnectionRefusedError):
+        print("Error: daemon not running. Start it with: python scripts/daemon.py")
+        sys.exit(1)
+
+    if not response["ok"]:
+        print(f"Error: {response['error']}")
+        sys.exit(1)
+    print(json.dumps(response["result"], indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Bulk URL Blocklist Importer
+Streams a blocklist file line by line, canonicalizes and deduplicates URLs
+(skipping ones already proposed on-chain) and submits them through
+submitWebsites() in gas-sized chunks with several transactions in flight.
+Progress is checkpointed so an interrupted import resumes without
+submitting any URL twice.
+
+Usage:
+    python scripts/import_blocklist.py blocklist.txt [--account 0] [--gas-budget 6000000] [--pipeline 4]
+"""
+import argparse
+import hashlib
+import ipaddress
+import json
+import os
+import re
+import sys
+import time
+from collections import deque
+from urllib.parse import urlsplit, urlunsplit
+
+from interact import DAOClient
+
+DEFAULT_GAS_BUDGET = 6_000_000
+DEFAULT_PIPELINE = 4
+DEFAULT_PORTS = {"http": 80, "https": 443}
+HOSTNAME_RE = re.compile(r"[a-z0-9_](?:[a-z0-9_-]*[a-z0-9_])?(?:\.[a-z0-9_](?:[a-z0-9_-]*[a-z0-9_])?)*")
+
+# Rough cost of one _createProposal call: fresh slots for id, proposer, startTime,
+# flags and the URL, one more slot per 32 bytes of long URLs, plus event and calldata
+SSTORE_NEW_SLOT = 22_100
+PROPOSAL_BASE_GAS = 5 * SSTORE_NEW_SLOT + 5_000
+CALLDATA_BYTE_GAS = 16
+
+
+def blocklist_urls(raw):
+    """Yield the canonical URL of every entry on a blocklist line.
+
+    Hosts-file lines ("0.0.0.0 a.example.com b.example.com") yield each of
+    their hosts; any other line with whitespace is rejected rather than
+    submitted as a garbage proposal.
+    """
+    fields = re.split(r"\s#", raw, maxsplit=1)[0].split()
+    if not fields or fields[0].startswith("#"):
+        return
+    if len(fields) == 1:
+        hosts = fields
+    elif _is_ip(fields[0]):
+        # Skip sink/loopback entries such as "0.0.0.0 0.0.0.0" or "127.0.0.1 localhost"
+        hosts = [host for host in fields[1:] if not _is_ip(host) and "." in host]
+    else:
+        return
+    for host in hosts:
+        url = canonicalize_url(host)
+        if url:
+            yield url
+
+
+def canonicalize_url(raw):
+    """Return the canonical form of a single URL, or None if it is not an http(s) URL.
+
+    Entries with whitespace, credentials or a host with characters invalid in
+    a hostname are rejected.
+    """
+    url = raw.strip()
+    if not url or any(c.isspace() for c in url):
+        return None
+    if "://" not in url:
+        url = "http://" + url
+
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return None
+
+    scheme = parts.scheme.lower()
+    # "mailto:x@y.com" would otherwise parse as user "mailto" at host y.com
+    if scheme not in DEFAULT_PORTS or "@" in parts.netloc:
+        return None
+    host = (parts.hostname or "").rstrip(".")
+    if ":" in host:
+        if not _is_ip(host):
+            return None
+        host = f"[{host}]"  # IPv6 literal
+    else:
+        try:
+            host = host.encode("idna").decode("ascii")
+        except UnicodeError:
+            return None
+        if not HOSTNAME_RE.fullmatch(host):
+            return None
+
+    netloc = host if port is None or DEFAULT_PORTS.get(scheme) == port else f"{host}:{port}"
+    path = "" if parts.path == "/" else parts.path
+    return urlunsplit((scheme, netloc, path, parts.query, ""))
+
+
+def _is_ip(value):
+    try:
+        ipaddress.ip_address(value)
+    except ValueError:
+        return False
+    return True
+
+
+def url_key(url):
+    """Compact fixed-size key used for deduplication."""
+    return hashlib.blake2b(url.encode("utf-8"), digest_size=16).digest()
+
+
+def estimate_url_gas(url):
+    size = len(url.encode("utf-8"))
+    extra_slots = (size + 31) // 32 if size > 31 else 0
+    return PROPOSAL_BASE_GAS + extra_slots * SSTORE_NEW_SLOT + size * CALLDATA_BYTE_GAS
+
+
+def load_proposed_keys(client):
+    """Collect keys of every URL already proposed, read from ProposalCreated events."""
+    keys = set()
+    for log in client.iter_logs("ProposalCreated"):
+        url = canonicalize_url(log.args.url)
+        if url:
+            keys.add(url_key(url))
+    return keys
+
+
+def wait_for_pending(w3, account, poll_interval=0.5):
+    # Transactions sent before a crash may not be in the checkpoint yet;
+    # let them land so the on-chain scan sees their URLs
+    while w3.eth.get_transaction_count(account, "pending") > w3.eth.get_transaction_count(account, "latest"):
+        time.sleep(poll_interval)
+
+
+class Checkpoint:
+    """Byte offset of the first blocklist line not yet confirmed on-chain."""
+
+    def __init__(self, path, contract_address):
+        self.path = path
+        self.contract_address = contract_address
+        self.offset = 0
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                data = json.load(f)
+            if data["address"] != contract_address:
+                raise Exception(f"Checkpoint {path} belongs to contract {data['address']}")
+            self.offset = data["offset"]
+
+    def save(self, offset):
+        self.offset = offset
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"address": self.contract_address, "offset": offset}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+
+class PipelinedSubmitter:
+    """Sends submitWebsites chunks with up to `depth` transactions awaiting receipts."""
+
+    def __init__(self, client, account, checkpoint, depth, gas_budget):
+        self.w3 = client.w3
+        self.contract = client.contract
+        self.account = account
+        self.checkpoint = checkpoint
+        self.depth = depth
+        self.gas_budget = gas_budget
+        self.inflight = deque()
+        self.submitted = 0
+        self.oversized = 0
+
+    def send(self, chunk):
+        # chunk: list of (url, end_offset) where end_offset follows the URL's line
+        urls = [url for url, _ in chunk]
+        fn = self.contract.functions.submitWebsites(urls)
+        gas = fn.estimate_gas({"from": self.account})
+        if gas > self.gas_budget:
+            if len(chunk) == 1:
+                # Sending it would run out of gas and revert on every resume
+                print(f"Skipping {urls[0]}: needs {gas} gas, budget is {self.gas_budget}")
+                self.oversized += 1
+                return
+            middle = len(chunk) // 2
+            self.send(chunk[:middle])
+            self.send(chunk[middle:])
+            return
+
+        while len(self.inflight) >= self.depth:
+            self._confirm_oldest()
+        tx_hash = fn.transact({"from": self.account, "gas": min(int(gas * 1.2), self.gas_budget)})
+        self.inflight.append((tx_hash, chunk[-1][1], len(urls)))
+
+    def drain(self):
+        while self.inflight:
+            self._confirm_oldest()
+
+    def _confirm_oldest(self):
+        tx_hash, end_offset, count = self.inflight.popleft()
+        receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+        if receipt.status != 1:
+            raise Exception(f"submitWebsites transaction {tx_hash.hex()} reverted")
+        self.checkpoint.save(end_offset)
+        self.submitted += count
+        print(f"Confirmed {count} URLs (total {self.submitted}, offset {end_offset})")
+
+
+def import_blocklist(client, path, account_index=0, gas_budget=DEFAULT_GAS_BUDGET,
+                     pipeline=DEFAULT_PIPELINE, checkpoint_path=None):
+    account = client.accounts[account_index]
+    if not client.contract.functions.members(account).call()[0]:
+        raise Exception(f"Account {account} is not a DAO member")
+
+    checkpoint = Checkpoint(checkpoint_path or path + ".checkpoint.json", client.contract_address)
+    wait_for_pending(client.w3, account)
+    seen = load_proposed_keys(client)
+    print(f"Resuming at byte {checkpoint.offset}, {len(seen)} URLs already proposed")
+
+    submitter = PipelinedSubmitter(client, account, checkpoint, pipeline, gas_budget)
+    skipped = oversized = 0
+    chunk, chunk_gas = [], 0
+    offset = checkpoint.offset
+    with open(path, "rb") as f:
+        f.seek(offset)
+        for raw in f:
+            offset += len(raw)
+            for url in blocklist_urls(raw.decode("utf-8", errors="replace")):
+                key = url_key(url)
+                if key in seen:
+                    skipped += 1
+                    continue
+                seen.add(key)
+
+                gas = estimate_url_gas(url)
+                if gas > gas_budget:
+                    oversized += 1
+                    continue
+                if chunk and chunk_gas + gas > gas_budget:
+                    submitter.send(chunk)
+                    chunk, chunk_gas = [], 0
+                chunk.append((url, offset))
+                chunk_gas += gas
+
+    if chunk:
+        submitter.send(chunk)
+    submitter.drain()
+    checkpoint.save(offset)
+    oversized += submitter.oversized
+    print(f"Import finished: {submitter.submitted} submitted, {skipped} duplicates skipped, "
+          f"{oversized} over the gas budget skipped")
+    return submitter.submitted, skipped, oversized
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import a URL blocklist into the DAO")
+    parser.add_argument("path", help="Blocklist file, one URL per line")
+    parser.add_argument("--account", type=int, default=0, help="Index of the submitting account")
+    parser.add_argument("--gas-budget", type=int, default=DEFAULT_GAS_BUDGET, help="Gas limit per transaction")
+    parser.add_argument("--pipeline", type=int, default=DEFAULT_PIPELINE, help="Transactions in flight")
+    parser.add_argument("--checkpoint", help="Checkpoint file (default: <path>.checkpoint.json)")
+    args = parser.parse_args()
+
+    try:
+        client = DAOClient()
+        import_blocklist(client, args.path, args.account, args.gas_budget, args.pipeline, args.checkpoint)
+    except Exception as e:
+        print(f"Error importing blocklist: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,12 @@
 import json
-from web3 import Web3
 import os
 
+LOG_BLOCK_RANGE = 10_000
+
 class DAOClient:
     def __init__(self):
+        # web3 is imported lazily so modules that only reference DAOClient start fast
+        from web3 import Web3
         self.w3 = Web3(Web3.HTTPProvider("http://127.0.0.1:8545"))
         
         # Add middleware for Ganache compatibility
@@ -46,6 +49,15 @@ class DAOClient:
         except Exception as e:
             print(f"Error submitting website: {e}")
 
+    def submit_websites(self, account_index, urls):
+        account = self.accounts[account_index]
+        try:
+            tx_hash = self.contract.functions.submitWebsites(urls).transact({"from": account})
+            self.w3.eth.wait_for_transaction_receipt(tx_hash)
+            print(f"Account {account} submitted {len(urls)} websites")
+        except Exception as e:
+            print(f"Error submitting websites: {e}")
+
     def vote(self, account_index, proposal_id, option):
         # 0: Scam, 1: HighRisk, 2: Normal, 3: Safe
         account = self.accounts[account_index]
@@ -66,6 +78,34 @@ class DAOClient:
         except Exception as e:
             print(f"Error processing proposal: {e}")
 
+    def prune_proposal(self, account_index, proposal_id, batch_size=100):
+        # Clears voter data of a processed proposal in batches until fully pruned
+        account = self.accounts[account_index]
+        try:
+            total_gas = 0
+            while not self.contract.functions.proposalPruned(proposal_id).call():
+                tx_hash = self.contract.functions.pruneProposal(proposal_id, batch_size).transact({"from": account})
+                receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+                total_gas += receipt.gasUsed
+            print(f"Proposal {proposal_id} pruned (gas used: {total_gas})")
+            return total_gas
+        except Exception as e:
+            print(f"Error pruning proposal: {e}")
+
+    def iter_logs(self, event_name, from_block=0, **filters):
+        # Pages through blocks so a single eth_getLogs never spans more than
+        # LOG_BLOCK_RANGE blocks; filters on indexed arguments become topics
+        latest = self.w3.eth.block_number
+        event = getattr(self.contract.events, event_name)()
+        for start in range(from_block, latest + 1, LOG_BLOCK_RANGE):
+            end = min(start + LOG_BLOCK_RANGE - 1, latest)
+            yield from event.get_logs(from_block=start, to_block=end, argument_filters=filters or None)
+
+    def get_ballots(self, proposal_id, from_block=0):
+        # Ballots are read from Voted events so they survive on-chain pruning
+        logs = self.iter_logs("Voted", from_block, proposalId=proposal_id)
+        return [(log.args.voter, log.args.option) for log in logs]
+
     def get_proposal_status(self, proposal_id):
         try:
             p = self.contract.functions.proposals(proposal_id).call()
@@ -114,3 +154,8 @@ if __name__ == "__main__":
     client.get_proposal_status(0)
     client.get_member_info(0) # Proposer should have rewards
     client.get_member_info(1) # Voter should have rewards
+    
+    print("\n--- 7. Prune Proposal ---")
+    client.prune_proposal(0, 0)
+    for voter, option in client.get_ballots(0):
+        print(f"  Ballot from event log: {voter} -> {option}")
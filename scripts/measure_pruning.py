@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Measure storage slots and gas before/after pruning a finalized proposal.
+Requires Ganache and a contract deployed with scripts/deploy.py.
+"""
+import sys
+from web3 import Web3
+from interact import DAOClient
+
+# Storage layout of ReputationDAO (see contracts/ReputationDAO.sol)
+MEMBERS_SLOT = 1
+PROPOSALS_SLOT = 3
+PROPOSAL_STRUCT_SIZE = 9   # id, websiteUrl, proposer, startTime, processed+active, voteCounts, voterChoice, voters, finalStatus
+VOTER_CHOICE_OFFSET = 6
+VOTERS_OFFSET = 7
+HAS_VOTED_OFFSET = 7       # isMember, tokens, role, joinedAt, proposalsSubmitted, votesCount, name, hasVoted
+
+def _word(value):
+    if isinstance(value, str):
+        return bytes.fromhex(value[2:]).rjust(32, b"\0")
+    return value.to_bytes(32, "big")
+
+def _keccak_slot(*parts):
+    return int.from_bytes(Web3.keccak(b"".join(_word(p) for p in parts)), "big")
+
+def voter_slots(proposal_id, voters):
+    """Return every storage slot holding per-voter data for a proposal."""
+    proposal_base = _keccak_slot(PROPOSALS_SLOT) + proposal_id * PROPOSAL_STRUCT_SIZE
+    voters_data = _keccak_slot(proposal_base + VOTERS_OFFSET)
+    slots = [proposal_base + VOTERS_OFFSET]
+    for j, voter in enumerate(voters):
+        member_base = _keccak_slot(voter, MEMBERS_SLOT)
+        slots.append(voters_data + j)
+        slots.append(_keccak_slot(voter, proposal_base + VOTER_CHOICE_OFFSET))
+        slots.append(_keccak_slot(proposal_id, member_base + HAS_VOTED_OFFSET))
+    return slots
+
+def count_nonzero(w3, address, slots):
+    return sum(1 for slot in slots if int.from_bytes(w3.eth.get_storage_at(address, slot), "big") != 0)
+
+def main():
+    client = DAOClient()
+    w3, contract = client.w3, client.contract
+    accounts = client.accounts
+    batch_size = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+
+    proposer = accounts[0]
+    voters = accounts[1:]
+    for i, voter in enumerate(voters):
+        if not contract.functions.members(voter).call()[0]:
+            tx = contract.functions.joinDAO(f"Voter {i + 1}").transact({"from": voter})
+            w3.eth.wait_for_transaction_receipt(tx)
+
+    tx = contract.functions.submitWebsite("http://prune-measurement.com").transact({"from": proposer})
+    w3.eth.wait_for_transaction_receipt(tx)
+    proposal_id = contract.functions.proposalCount().call() - 1
+
+    vote_gas = 0
+    for i, voter in enumerate(voters):
+        tx = contract.functions.vote(proposal_id, i % 2).transact({"from": voter})
+        vote_gas += w3.eth.wait_for_transaction_receipt(tx).gasUsed
+
+    tx = contract.functions.processProposal(proposal_id).transact({"from": proposer})
+    process_gas = w3.eth.wait_for_transaction_receipt(tx).gasUsed
+
+    slots = voter_slots(proposal_id, voters)
+    before = count_nonzero(w3, client.contract_address, slots)
+
+    prune_gas = 0
+    prune_txs = 0
+    while not contract.functions.proposalPruned(proposal_id).call():
+        tx = contract.functions.pruneProposal(proposal_id, batch_size).transact({"from": proposer})
+        prune_gas += w3.eth.wait_for_transaction_receipt(tx).gasUsed
+        prune_txs += 1
+
+    after = count_nonzero(w3, client.contract_address, slots)
+
+    print(f"Proposal {proposal_id} with {len(voters)} voters")
+    print(f"  Gas: votes={vote_gas}, process={process_gas}, prune={prune_gas} ({prune_txs} tx, batch={batch_size})")
+    print(f"  Per-voter storage slots: before={before}, after={after}, freed={before - after}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+ReputationDAO Simulator
+In-memory model of the contract's join, submit, vote, process and prune
+rules for fast what-if runs. VOTE_THRESHOLD, REWARD_AMOUNT, the proposer
+reward and the tie-breaking rule are constructor parameters; with the
+defaults the model matches contracts/ReputationDAO.sol, which
+tests/test_simulator.py checks against the real contract on random
+transaction sequences.
+
+State is array-backed: members and proposals are compact integer ids and
+per-member / per-proposal fields live in parallel arrays. Failed rules raise
+Revert with the same message the contract reverts with.
+
+Usage:
+    python scripts/simulator.py [num_proposals]
+"""
+import random
+import sys
+import time
+from array import array
+
+NUM_OPTIONS = 4  # Scam, HighRisk, Normal, Safe
+ROLE_MEMBER, ROLE_MODERATOR, ROLE_ADMIN = 0, 1, 2
+# has_voted keys are proposal_id * VOTE_KEY_STRIDE + member_id. A prime stride
+# (rather than a << 32 shift) spreads both ids into the low bits that set
+# hashing uses, so one member's votes do not collide.
+VOTE_KEY_STRIDE = 4_294_967_311
+
+
+class Revert(Exception):
+    """Raised where the contract would revert; the message matches the require()."""
+
+
+def lowest_option(counts):
+    """processProposal rule: strictly greater count wins, so ties go to the lowest option."""
+    return counts.index(max(counts))
+
+
+def highest_option(counts):
+    """Alternative rule: ties go to the highest (safest) option."""
+    best = max(counts)
+    return NUM_OPTIONS - 1 - counts[::-1].index(best)
+
+
+class ReputationDAOSim:
+    __slots__ = (
+        "vote_threshold", "reward_amount", "proposer_reward", "tie_break",
+        "member_ids", "member_address", "is_member", "tokens", "role",
+        "proposals_submitted", "votes_count", "names", "total_members",
+        "proposer", "urls", "processed", "active", "final_status",
+        "vote_counts", "voters", "voter_choices", "has_voted", "prune_started", "pruned",
+    )
+
+    def __init__(self, admin, vote_threshold=3, reward_amount=10, proposer_reward=None, tie_break=lowest_option):
+        self.vote_threshold = vote_threshold
+        self.reward_amount = reward_amount
+        self.proposer_reward = reward_amount * 2 if proposer_reward is None else proposer_reward
+        self.tie_break = tie_break
+
+        # Members, indexed by compact member id
+        self.member_ids = {}
+        self.member_address = []
+        self.is_member = bytearray()
+        self.tokens = array("q")
+        self.role = bytearray()
+        self.proposals_submitted = array("q")
+        self.votes_count = array("q")
+        self.names = []
+        self.total_members = 0
+
+        # Proposals, indexed by proposal id
+        self.proposer = array("l")
+        self.urls = []
+        self.processed = bytearray()
+        self.active = bytearray()
+        self.final_status = bytearray()
+        self.vote_counts = array("q")     # NUM_OPTIONS entries per proposal
+        self.voters = []                  # per proposal: array of member ids
+        self.voter_choices = []           # per proposal: bytearray parallel to voters
+        self.has_voted = set()            # int keys, see VOTE_KEY_STRIDE
+        self.prune_started = bytearray()
+        self.pruned = bytearray()
+
+        admin_id = self._member_id(admin)
+        self.is_member[admin_id] = 1
+        self.tokens[admin_id] = 1000
+        self.role[admin_id] = ROLE_ADMIN
+        self.names[admin_id] = "Admin"
+        self.total_members = 1
+
+    def _member_id(self, address):
+        member_id = self.member_ids.get(address)
+        if member_id is None:
+            member_id = len(self.member_address)
+            self.member_ids[address] = member_id
+            self.member_address.append(address)
+            self.is_member.append(0)
+            self.tokens.append(0)
+            self.role.append(ROLE_MEMBER)
+            self.proposals_submitted.append(0)
+            self.votes_count.append(0)
+            self.names.append("")
+        return member_id
+
+    def _require_member(self, sender):
+        member_id = self.member_ids.get(sender)
+        if member_id is None or not self.is_member[member_id]:
+            raise Revert("Not a member")
+        return member_id
+
+    @property
+    def proposal_count(self):
+        return len(self.urls)
+
+    def join_dao(self, sender, name):
+        member_id = self._member_id(sender)
+        if self.is_member[member_id]:
+            raise Revert("Already a member")
+        if not 0 < len(name.encode("utf-8")) <= 50:
+            raise Revert("Name must be 1-50 characters")
+        self.is_member[member_id] = 1
+        self.tokens[member_id] = 100
+        self.role[member_id] = ROLE_MEMBER
+        self.names[member_id] = name
+        self.total_members += 1
+
+    def submit_website(self, sender, url):
+        member_id = self._require_member(sender)
+        self._create_proposal(member_id, url)
+        return self.proposal_count - 1
+
+    def submit_websites(self, sender, urls):
+        member_id = self._require_member(sender)
+        if not urls:
+            raise Revert("No URLs provided")
+        for url in urls:
+            self._create_proposal(member_id, url)
+
+    def _create_proposal(self, member_id, url):
+        self.proposer.append(member_id)
+        self.urls.append(url)
+        self.processed.append(0)
+        self.active.append(1)
+        self.final_status.append(0)
+        self.vote_counts.extend((0, 0, 0, 0))
+        self.voters.append(array("l"))
+        self.voter_choices.append(bytearray())
+        self.prune_started.append(0)
+        self.pruned.append(0)
+        self.proposals_submitted[member_id] += 1
+
+    def vote(self, sender, proposal_id, option):
+        # Hot path: member check is inlined and attributes are read once
+        member_id = self.member_ids.get(sender)
+        if member_id is None or not self.is_member[member_id]:
+            raise Revert("Not a member")
+        # Contract parameters are unsigned, so negative values are out of range too
+        if not 0 <= proposal_id < len(self.urls):
+            raise Revert("Invalid proposal ID")
+        if not 0 <= option <= 3:
+            raise Revert("Invalid option")
+        key = proposal_id * VOTE_KEY_STRIDE + member_id
+        has_voted = self.has_voted
+        if key in has_voted:
+            raise Revert("Already voted")
+        if self.processed[proposal_id]:
+            raise Revert("Proposal already processed")
+        if not self.active[proposal_id]:
+            raise Revert("Proposal is not active")
+
+        self.vote_counts[proposal_id * NUM_OPTIONS + option] += 1
+        self.voters[proposal_id].append(member_id)
+        self.voter_choices[proposal_id].append(option)
+        has_voted.add(key)
+        self.votes_count[member_id] += 1
+
+    def process_proposal(self, sender, proposal_id):
+        if not 0 <= proposal_id < len(self.urls):
+            raise Revert("Invalid proposal ID")
+        if self.processed[proposal_id]:
+            raise Revert("Already processed")
+        if not self.active[proposal_id]:
+            raise Revert("Proposal is not active")
+        base = proposal_id * NUM_OPTIONS
+        counts = self.vote_counts[base:base + NUM_OPTIONS].tolist()
+        if sum(counts) < self.vote_threshold:
+            raise Revert("Not enough votes to finalize")
+
+        winner = self.tie_break(counts)
+        self.final_status[proposal_id] = winner
+        self.processed[proposal_id] = 1
+
+        self.tokens[self.proposer[proposal_id]] += self.proposer_reward
+        tokens, reward = self.tokens, self.reward_amount
+        for member_id, choice in zip(self.voters[proposal_id], self.voter_choices[proposal_id]):
+            if choice == winner:
+                tokens[member_id] += reward
+        return winner
+
+    def prune_proposal(self, sender, proposal_id, max_voters):
+        if not 0 <= proposal_id < len(self.urls):
+            raise Revert("Invalid proposal ID")
+        if max_voters <= 0:
+            raise Revert("Batch size must be positive")
+        if not self.processed[proposal_id]:
+            raise Revert("Proposal not processed")
+        if self.pruned[proposal_id]:
+            raise Revert("Already pruned")
+
+        self.prune_started[proposal_id] = 1
+        voters, choices = self.voters[proposal_id], self.voter_choices[proposal_id]
+        cleared = min(max_voters, len(voters))
+        key_base = proposal_id * VOTE_KEY_STRIDE
+        for _ in range(cleared):
+            self.has_voted.discard(key_base + voters.pop())
+            choices.pop()
+        if not voters:
+            self.pruned[proposal_id] = 1
+        return cleared
+
+    def fork(self, vote_threshold=None, reward_amount=None, proposer_reward=None, tie_break=None):
+        """Copy of the current state under a different policy.
+
+        Ballots do not depend on the reward policy, so a sweep can cast votes
+        once and settle the same ballots under each policy on a fork.
+        """
+        clone = ReputationDAOSim.__new__(ReputationDAOSim)
+        for slot in ReputationDAOSim.__slots__:
+            value = getattr(self, slot)
+            if isinstance(value, (dict, set)):
+                value = value.copy()
+            elif isinstance(value, (array, bytearray, list)):
+                value = value[:]
+            setattr(clone, slot, value)
+        clone.voters = [v[:] for v in self.voters]
+        clone.voter_choices = [c[:] for c in self.voter_choices]
+
+        if vote_threshold is not None:
+            clone.vote_threshold = vote_threshold
+        if reward_amount is not None:
+            clone.reward_amount = reward_amount
+            clone.proposer_reward = reward_amount * 2
+        if proposer_reward is not None:
+            clone.proposer_reward = proposer_reward
+        if tie_break is not None:
+            clone.tie_break = tie_break
+        return clone
+
+    def get_proposal_votes(self, proposal_id):
+        # Stricter than the contract, whose getter returns zeros for unknown ids
+        if not 0 <= proposal_id < len(self.urls):
+            raise Revert("Invalid proposal ID")
+        base = proposal_id * NUM_OPTIONS
+        return tuple(self.vote_counts[base:base + NUM_OPTIONS])
+
+    def get_proposal_voters(self, proposal_id):
+        if not 0 <= proposal_id < len(self.urls):
+            raise Revert("Invalid proposal ID")
+        if self.prune_started[proposal_id]:
+            raise Revert("Proposal pruned, read Voted events")
+        return [self.member_address[m] for m in self.voters[proposal_id]]
+
+    def get_member_info(self, address):
+        """(isMember, tokens, role, proposalsSubmitted, votesCount, name); joinedAt is not modeled."""
+        m = self.member_ids.get(address)
+        if m is None:
+            return (False, 0, ROLE_MEMBER, 0, 0, "")
+        return (
+            bool(self.is_member[m]), self.tokens[m], self.role[m],
+            self.proposals_submitted[m], self.votes_count[m], self.names[m],
+        )
+
+
+def random_transactions(rng, accounts, count, urls_per_batch=3):
+    """Random (method, sender, *args) sequence mixing valid and reverting calls.
+
+    All accounts but the last join first and votes favour recent proposals
+    so that sequences regularly reach the threshold, finalize and prune.
+    """
+    for i, account in enumerate(accounts[1:-1]):
+        yield ("join_dao", account, f"Member {i}")
+
+    proposals = 0
+    for i in range(count):
+        sender = rng.choice(accounts)
+        recent = rng.randint(max(0, proposals - 4), proposals)  # proposals itself is out of range
+        kind = rng.random()
+        if kind < 0.05:
+            yield ("join_dao", sender, rng.choice(["", "Late", "x" * 51]))
+        elif kind < 0.17:
+            # Submitters are always members so proposal ids stay predictable
+            yield ("submit_website", rng.choice(accounts[:-1]), f"http://site-{i}.com")
+            proposals += 1
+        elif kind < 0.2:
+            batch = [f"http://batch-{i}-{j}.com" for j in range(rng.randint(0, urls_per_batch))]
+            yield ("submit_websites", rng.choice(accounts[:-1]), batch)
+            proposals += len(batch)
+        elif kind < 0.75:
+            yield ("vote", sender, recent, rng.choice([0, 0, 1, 2, 3, 3, 4]))
+        elif kind < 0.9:
+            yield ("process_proposal", sender, recent)
+        else:
+            yield ("prune_proposal", sender, rng.randint(0, proposals), rng.choice([0, 1, 2, 10]))
+
+
+def apply(sim, tx):
+    """Apply one transaction; return the revert message or None on success."""
+    method, sender, *args = tx
+    try:
+        getattr(sim, method)(sender, *args)
+    except Revert as e:
+        return str(e)
+    return None
+
+
+def main():
+    num_proposals = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = random.Random(0)
+    members = [f"0x{i:040x}" for i in range(1, 1001)]
+
+    sim = ReputationDAOSim(members[0])
+    for i, member in enumerate(members[1:]):
+        sim.join_dao(member, f"Member {i}")
+
+    # Cast the ballots once; each policy below settles them on a fork
+    ballots = []
+    for proposal_id in range(num_proposals):
+        sim.submit_website(members[0], f"http://site-{proposal_id}.com")
+        for member in rng.sample(members[1:], rng.randint(1, 8)):
+            ballots.append((member, proposal_id, rng.randint(0, 3)))
+
+    vote = sim.vote
+    start = time.perf_counter()
+    for member, proposal_id, option in ballots:
+        vote(member, proposal_id, option)
+    elapsed = time.perf_counter() - start
+    print(f"Cast {len(ballots):,} votes on {num_proposals:,} proposals: {len(ballots) / elapsed:,.0f} votes/s")
+
+    print("\nReward policy sweep")
+    for tie_break in (lowest_option, highest_option):
+        for threshold in (3, 5):
+            for reward in (10, 25):
+                run = sim.fork(threshold, reward, tie_break=tie_break)
+                process = run.process_proposal
+                start = time.perf_counter()
+                finalized = settled = 0
+                for proposal_id in range(num_proposals):
+                    try:
+                        process(members[0], proposal_id)
+                    except Revert:
+                        continue
+                    finalized += 1
+                    settled += len(run.voters[proposal_id])
+                elapsed = time.perf_counter() - start
+
+                # Only ballots on finalized proposals count as settled; the
+                # elapsed time still includes the proposals that reverted
+                voter_tokens = run.tokens[1:]
+                print(
+                    f"  {tie_break.__name__:<15} threshold={threshold} reward={reward}: "
+                    f"{finalized:,} finalized, mean voter tokens {sum(voter_tokens) / len(voter_tokens):8.1f}, "
+                    f"{finalized / elapsed:,.0f} proposals/s, {settled / elapsed:,.0f} ballots settled/s"
+                )
+
+
+if __name__ == "__main__":
+    main()
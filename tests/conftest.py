@@ -0,0 +1,62 @@
+import pytest
+import os
+
+# Connect to Ganache
+@pytest.fixture(scope="module")
+def w3():
+    from web3 import Web3
+    w3_instance = Web3(Web3.HTTPProvider("http://127.0.0.1:8545"))
+    
+    # Add middleware for Ganache compatibility
+    from web3.middleware import ExtraDataToPOAMiddleware
+    w3_instance.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
+    
+    try:
+        # Test connection
+        w3_instance.eth.block_number
+    except Exception as e:
+        raise AssertionError(f"Ganache not connected: {e}")
+    
+    return w3_instance
+
+# Compile once per test session; returns (abi, bytecode)
+@pytest.fixture(scope="session")
+def compiled_contract():
+    from solcx import compile_standard, install_solc
+    install_solc("0.8.0")
+    
+    contract_path = os.path.join("contracts", "ReputationDAO.sol")
+    with open(contract_path, "r") as f:
+        contract_source = f.read()
+
+    compiled_sol = compile_standard(
+        {
+            "language": "Solidity",
+            "sources": {"ReputationDAO.sol": {"content": contract_source}},
+            "settings": {
+                "outputSelection": {
+                    "*": {
+                        "*": ["abi", "metadata", "evm.bytecode", "evm.sourceMap"]
+                    }
+                }
+            },
+        },
+        solc_version="0.8.0",
+    )
+
+    bytecode = compiled_sol["contracts"]["ReputationDAO.sol"]["ReputationDAO"]["evm"]["bytecode"]["object"]
+    abi = compiled_sol["contracts"]["ReputationDAO.sol"]["ReputationDAO"]["abi"]
+    return abi, bytecode
+
+# Deploys a fresh ReputationDAO from accounts[0]
+@pytest.fixture(scope="module")
+def deploy_contract(w3, compiled_contract):
+    abi, bytecode = compiled_contract
+
+    def deploy():
+        ReputationDAO = w3.eth.contract(abi=abi, bytecode=bytecode)
+        tx_hash = ReputationDAO.constructor().transact({"from": w3.eth.accounts[0]})
+        tx_receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
+        return w3.eth.contract(address=tx_receipt.contractAddress, abi=abi)
+
+    return deploy
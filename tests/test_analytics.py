@@ -0,0 +1,93 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+from analytics import VoteData, NO_VOTE
+
+BALLOTS = [
+    # proposal 0: Scam wins 2-1
+    (0, "0xA", 0), (0, "0xB", 0), (0, "0xC", 3),
+    # proposal 1: Safe wins 2-1
+    (1, "0xA", 3), (1, "0xB", 3), (1, "0xC", 1),
+    # proposal 2: still pending
+    (2, "0xA", 2), (2, "0xC", 1),
+]
+
+def test_choice_matrix():
+    """Test 1: Verify ballots map to a compact int8 voter x proposal matrix"""
+    data = VoteData.from_ballots(BALLOTS, num_proposals=4)
+    
+    assert data.members == ["0xA", "0xB", "0xC"]
+    matrix = data.choice_matrix()
+    assert matrix.dtype == np.int8
+    assert matrix.shape == (3, 4)
+    assert matrix[0].tolist() == [0, 3, 2, NO_VOTE]
+    assert matrix[1].tolist() == [0, 3, NO_VOTE, NO_VOTE]
+
+def test_majority_agreement_uses_final_status():
+    """Test 2: Verify agreement is measured against finalized outcomes only"""
+    # Proposal 2 was never finalized; proposal 1 was finalized against the vote split
+    data = VoteData.from_ballots(BALLOTS, num_proposals=4, outcomes={0: 0, 1: 1})
+    
+    assert data.final_status.tolist() == [0, 1, NO_VOTE, NO_VOTE]
+    agreement = data.majority_agreement()
+    assert agreement[0] == 1 / 2
+    assert agreement[1] == 1 / 2
+    assert agreement[2] == 1 / 2
+
+def test_pending_votes_do_not_count():
+    """Test 3: Verify a lone vote on a pending proposal does not score as agreement"""
+    data = VoteData.from_ballots([(0, "0xA", 2), (1, "0xA", 0), (1, "0xB", 3)], outcomes={1: 3})
+    
+    agreement = data.majority_agreement()
+    assert agreement[0] == 0.0
+    assert agreement[1] == 1.0
+
+def test_pairwise_agreement_blocks():
+    """Test 4: Verify blockwise pairwise agreement matches a direct computation"""
+    rng = np.random.default_rng(0)
+    ballots = [
+        (p, m, int(rng.integers(0, 4)))
+        for p in range(50) for m in range(12) if rng.random() < 0.6
+    ]
+    data = VoteData.from_ballots(ballots)
+    agree, overlap = data.pairwise_agreement(block_size=7, stripe_rows=5)
+    
+    matrix = data.choice_matrix()
+    for i in range(data.num_members):
+        for j in range(data.num_members):
+            both = (matrix[i] != NO_VOTE) & (matrix[j] != NO_VOTE)
+            assert overlap[i, j] == both.sum()
+            if both.any():
+                assert np.isclose(agree[i, j], (matrix[i][both] == matrix[j][both]).mean())
+            else:
+                assert np.isnan(agree[i, j])
+
+def test_collusion_blocs():
+    """Test 5: Verify voters who always vote together form a bloc"""
+    rng = np.random.default_rng(1)
+    ballots = []
+    for p in range(100):
+        bloc_choice = int(rng.integers(0, 4))
+        for m in ["0xB1", "0xB2", "0xB3"]:
+            ballots.append((p, m, bloc_choice))
+        for m in ["0xI1", "0xI2", "0xI3", "0xI4"]:
+            ballots.append((p, m, int(rng.integers(0, 4))))
+    data = VoteData.from_ballots(ballots)
+    
+    blocs = data.collusion_blocs(threshold=0.95, min_overlap=20, stripe_rows=3)
+    
+    assert len(blocs) == 1
+    assert sorted(data.members[m] for m in blocs[0]) == ["0xB1", "0xB2", "0xB3"]
+
+def test_proposals_without_voters():
+    """Test 6: Verify a DAO with proposals but no ballots yields empty results"""
+    data = VoteData.from_ballots([], num_proposals=3)
+    
+    agree, overlap = data.pairwise_agreement()
+    assert agree.shape == overlap.shape == (0, 0)
+    assert data.majority_agreement().shape == (0,)
+    assert data.collusion_blocs() == []
@@ -1,57 +1,11 @@
 import pytest
-from web3 import Web3
-from solcx import compile_standard, install_solc
-import os
 
-# Connect to Ganache
-@pytest.fixture(scope="module")
-def w3():
-    w3_instance = Web3(Web3.HTTPProvider("http://127.0.0.1:8545"))
-    
-    # Add middleware for Ganache compatibility
-    from web3.middleware import ExtraDataToPOAMiddleware
-    w3_instance.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
-    
-    try:
-        # Test connection
-        w3_instance.eth.block_number
-    except Exception as e:
-        raise AssertionError(f"Ganache not connected: {e}")
-    
-    return w3_instance
+# w3, compiled_contract and deploy_contract fixtures live in conftest.py
 
 # Deploy contract once for all tests
 @pytest.fixture(scope="module")
-def contract(w3):
-    install_solc("0.8.0")
-    
-    contract_path = os.path.join("contracts", "ReputationDAO.sol")
-    with open(contract_path, "r") as f:
-        contract_source = f.read()
-
-    compiled_sol = compile_standard(
-        {
-            "language": "Solidity",
-            "sources": {"ReputationDAO.sol": {"content": contract_source}},
-            "settings": {
-                "outputSelection": {
-                    "*": {
-                        "*": ["abi", "metadata", "evm.bytecode", "evm.sourceMap"]
-                    }
-                }
-            },
-        },
-        solc_version="0.8.0",
-    )
-
-    bytecode = compiled_sol["contracts"]["ReputationDAO.sol"]["ReputationDAO"]["evm"]["bytecode"]["object"]
-    abi = compiled_sol["contracts"]["ReputationDAO.sol"]["ReputationDAO"]["abi"]
-
-    ReputationDAO = w3.eth.contract(abi=abi, bytecode=bytecode)
-    tx_hash = ReputationDAO.constructor().transact({"from": w3.eth.accounts[0]})
-    tx_receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
-
-    return w3.eth.contract(address=tx_receipt.contractAddress, abi=abi)
+def contract(deploy_contract):
+    return deploy_contract()
 
 def test_join_dao(w3, contract):
     """Test 1: Verify users can join DAO and receive initial tokens"""
@@ -279,3 +233,123 @@ def test_get_voter_choice(w3, contract):
     choice = contract.functions.getVoterChoice(proposal_id, voter).call()
     
     assert choice == 2, "Voter choice should be option 2 (Normal)"
+
+def test_prune_processed_proposal(w3, contract):
+    """Test 12: Verify pruning clears voter data but keeps the summary"""
+    proposer = w3.eth.accounts[1]
+    voters = w3.eth.accounts[2:5]
+    
+    tx = contract.functions.submitWebsite("http://prune-test.com").transact({"from": proposer})
+    w3.eth.wait_for_transaction_receipt(tx)
+    
+    proposal_id = contract.functions.proposalCount().call() - 1
+    
+    contract.functions.vote(proposal_id, 0).transact({"from": voters[0]})
+    contract.functions.vote(proposal_id, 0).transact({"from": voters[1]})
+    contract.functions.vote(proposal_id, 3).transact({"from": voters[2]})
+    contract.functions.processProposal(proposal_id).transact({"from": proposer})
+    
+    tx = contract.functions.pruneProposal(proposal_id, 10).transact({"from": proposer})
+    w3.eth.wait_for_transaction_receipt(tx)
+    
+    assert contract.functions.proposalPruned(proposal_id).call() == True
+    
+    # Summary record is kept
+    votes = contract.functions.getProposalVotes(proposal_id).call()
+    assert votes[0] == 2 and votes[3] == 1
+    p = contract.functions.proposals(proposal_id).call()
+    assert p[4] == True  # processed
+    
+    with pytest.raises(Exception) as exc_info:
+        contract.functions.getVoterChoice(proposal_id, voters[0]).call()
+    
+    assert "Proposal pruned" in str(exc_info.value)
+    
+    with pytest.raises(Exception) as exc_info:
+        contract.functions.getProposalVoters(proposal_id).call()
+    
+    assert "Proposal pruned" in str(exc_info.value)
+    
+    # Ballots remain available from event logs, filtered by the indexed proposalId
+    logs = contract.events.Voted().get_logs(from_block=0, argument_filters={"proposalId": proposal_id})
+    ballots = [(l.args.voter, l.args.option) for l in logs]
+    assert ballots == [(voters[0], 0), (voters[1], 0), (voters[2], 3)]
+
+def test_prune_in_batches(w3, contract):
+    """Test 13: Verify pruning can be split across bounded batches"""
+    proposer = w3.eth.accounts[1]
+    voters = w3.eth.accounts[2:5]
+    
+    tx = contract.functions.submitWebsite("http://prune-batch-test.com").transact({"from": proposer})
+    w3.eth.wait_for_transaction_receipt(tx)
+    
+    proposal_id = contract.functions.proposalCount().call() - 1
+    
+    for voter in voters:
+        contract.functions.vote(proposal_id, 1).transact({"from": voter})
+    contract.functions.processProposal(proposal_id).transact({"from": proposer})
+    
+    contract.functions.pruneProposal(proposal_id, 2).transact({"from": proposer})
+    assert contract.functions.pruneStarted(proposal_id).call() == True
+    assert contract.functions.proposalPruned(proposal_id).call() == False
+    
+    # Partly pruned proposals already refuse per-voter reads, even for voters not yet cleared
+    for voter in voters:
+        with pytest.raises(Exception) as exc_info:
+            contract.functions.getVoterChoice(proposal_id, voter).call()
+        assert "Proposal pruned" in str(exc_info.value)
+    
+    with pytest.raises(Exception) as exc_info:
+        contract.functions.getProposalVoters(proposal_id).call()
+    
+    assert "Proposal pruned" in str(exc_info.value)
+    
+    contract.functions.pruneProposal(proposal_id, 2).transact({"from": proposer})
+    assert contract.functions.proposalPruned(proposal_id).call() == True
+    
+    with pytest.raises(Exception) as exc_info:
+        contract.functions.pruneProposal(proposal_id, 2).transact({"from": proposer})
+    
+    assert "Already pruned" in str(exc_info.value)
+
+def test_cannot_prune_unprocessed_proposal(w3, contract):
+    """Test 14: Verify only finalized proposals can be pruned"""
+    proposer = w3.eth.accounts[1]
+    voter = w3.eth.accounts[2]
+    
+    tx = contract.functions.submitWebsite("http://prune-pending-test.com").transact({"from": proposer})
+    w3.eth.wait_for_transaction_receipt(tx)
+    
+    proposal_id = contract.functions.proposalCount().call() - 1
+    
+    contract.functions.vote(proposal_id, 0).transact({"from": voter})
+    
+    with pytest.raises(Exception) as exc_info:
+        contract.functions.pruneProposal(proposal_id, 10).transact({"from": proposer})
+    
+    assert "Proposal not processed" in str(exc_info.value)
+
+def test_submit_websites_batch(w3, contract):
+    """Test 15: Verify submitWebsites creates one proposal per URL"""
+    proposer = w3.eth.accounts[1]
+    urls = ["http://batch-1.com", "http://batch-2.com", "http://batch-3.com"]
+    
+    initial_count = contract.functions.proposalCount().call()
+    submitted_before = contract.functions.members(proposer).call()[4]
+    
+    tx = contract.functions.submitWebsites(urls).transact({"from": proposer})
+    w3.eth.wait_for_transaction_receipt(tx)
+    
+    assert contract.functions.proposalCount().call() == initial_count + len(urls)
+    for i, url in enumerate(urls):
+        p = contract.functions.proposals(initial_count + i).call()
+        assert p[0] == initial_count + i
+        assert p[1] == url
+        assert p[2] == proposer
+    
+    assert contract.functions.members(proposer).call()[4] == submitted_before + len(urls)
+    
+    with pytest.raises(Exception) as exc_info:
+        contract.functions.submitWebsites([]).transact({"from": proposer})
+    
+    assert "No URLs provided" in str(exc_info.value)
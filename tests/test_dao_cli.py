@@ -0,0 +1,74 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+import pytest
+
+from dao_cli import build_request, parse_arg
+from daemon import to_json
+
+def test_parse_arg():
+    """Test 1: Verify CLI arguments decode as JSON with a string fallback"""
+    assert parse_arg("3") == 3
+    assert parse_arg('["http://a.com", "http://b.com"]') == ["http://a.com", "http://b.com"]
+    assert parse_arg("http://a.com") == "http://a.com"
+    assert parse_arg("0x5EF08b21aF79953d9CAb48857a1Ae88bA68E5110") == "0x5EF08b21aF79953d9CAb48857a1Ae88bA68E5110"
+
+def test_build_request():
+    """Test 2: Verify commands map to daemon requests"""
+    assert build_request(["ping"]) == {"method": "ping"}
+    assert build_request(["call", "proposals", "0"]) == {"method": "call", "function": "proposals", "args": [0]}
+    assert build_request(["transact", "1", "vote", "0", "2"]) == {
+        "method": "transact", "account": 1, "function": "vote", "args": [0, 2]
+    }
+    
+    with pytest.raises(ValueError):
+        build_request(["transact", "1"])
+
+def test_to_json():
+    """Test 3: Verify contract return values become JSON types"""
+    assert to_json((0, "http://a.com", b"\x01\x02", [True])) == [0, "http://a.com", "0x0102", [True]]
+    assert to_json({"status": 1, "hash": b"\xff"}) == {"status": 1, "hash": "0xff"}
+
+def test_daemon_serves_requests(tmp_path):
+    """Test 4: Verify the daemon answers call, reports errors and shuts down"""
+    from types import SimpleNamespace
+    import threading
+    
+    from dao_cli import send_request
+    from daemon import DAODaemon
+    
+    proposal = (0, "http://daemon-test.com", "0xProposer", 1700000000, False, True, 0)
+    client = SimpleNamespace(
+        contract_address="0xContract",
+        accounts=["0xAdmin"],
+        contract=SimpleNamespace(functions=SimpleNamespace(
+            proposals=lambda i: SimpleNamespace(call=lambda: proposal),
+        )),
+    )
+    socket_path = str(tmp_path / "dao.sock")
+    server = DAODaemon(socket_path)
+    server.get_client = lambda: client
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    try:
+        response = send_request({"method": "call", "function": "proposals", "args": [0]}, socket_path)
+        assert response == {"ok": True, "result": list(proposal)}
+        
+        response = send_request({"method": "accounts"}, socket_path)
+        assert response == {"ok": True, "result": ["0xAdmin"]}
+        
+        response = send_request({"method": "frobnicate"}, socket_path)
+        assert response["ok"] == False
+        assert "Unknown method" in response["error"]
+        
+        response = send_request({"method": "shutdown"}, socket_path)
+        assert response["ok"] == True
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+    finally:
+        if thread.is_alive():
+            server.shutdown()
+            thread.join()
+        server.server_close()
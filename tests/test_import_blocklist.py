@@ -0,0 +1,241 @@
+import json
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+from import_blocklist import (
+    Checkpoint,
+    PipelinedSubmitter,
+    blocklist_urls,
+    canonicalize_url,
+    estimate_url_gas,
+    import_blocklist,
+    url_key,
+)
+
+CONTRACT = "0xContract"
+ACCOUNT = "0xImporter"
+
+class Crash(Exception):
+    pass
+
+class FakeChain:
+    """Minimal stand-in for DAOClient: submitWebsites txs mine instantly, receipts on request."""
+
+    def __init__(self, proposed=(), gas_per_url=50_000, crash_on_receipt=None, revert_tx=None):
+        self.proposed = list(proposed)   # URLs in ProposalCreated events
+        self.sent = []                   # (urls, gas) per transaction
+        self.receipts_waited = 0
+        self.gas_per_url = gas_per_url
+        self.crash_on_receipt = crash_on_receipt
+        self.revert_tx = revert_tx
+
+        self.accounts = [ACCOUNT]
+        self.contract_address = CONTRACT
+        self.w3 = SimpleNamespace(eth=self)
+        self.contract = SimpleNamespace(
+            functions=SimpleNamespace(members=self._members, submitWebsites=self._submit_websites),
+        )
+
+    def _members(self, account):
+        return SimpleNamespace(call=lambda: (True, 100))
+
+    def _submit_websites(self, urls):
+        def transact(tx):
+            index = len(self.sent)
+            self.sent.append((list(urls), tx["gas"]))
+            if index != self.revert_tx:
+                self.proposed.extend(urls)
+            return index.to_bytes(32, "big")
+        return SimpleNamespace(estimate_gas=lambda tx: self.gas_per_url * len(urls), transact=transact)
+
+    def iter_logs(self, event_name, from_block=0, **filters):
+        assert event_name == "ProposalCreated"
+        return [SimpleNamespace(args=SimpleNamespace(url=url)) for url in self.proposed]
+
+    def get_transaction_count(self, account, block):
+        return len(self.sent)
+
+    def wait_for_transaction_receipt(self, tx_hash):
+        self.receipts_waited += 1
+        if self.receipts_waited == self.crash_on_receipt:
+            raise Crash()
+        index = int.from_bytes(tx_hash, "big")
+        return SimpleNamespace(status=0 if index == self.revert_tx else 1, gasUsed=21_000)
+
+def chunk(*urls, start=0):
+    return [(url, start + i + 1) for i, url in enumerate(urls)]
+
+def test_canonicalize_url():
+    """Test 1: Verify equivalent URLs share one canonical form"""
+    assert canonicalize_url("Example.COM\n") == "http://example.com"
+    assert canonicalize_url("http://example.com/") == "http://example.com"
+    assert canonicalize_url("HTTPS://Example.com:443/a?b=1#frag") == "https://example.com/a?b=1"
+    assert canonicalize_url("example.com:8080/x") == "http://example.com:8080/x"
+
+def test_canonicalize_skips_non_urls():
+    """Test 2: Verify blank lines, comments and malformed entries are skipped"""
+    assert canonicalize_url("") is None
+    assert canonicalize_url("   \n") is None
+    assert canonicalize_url("# comment") is None
+    assert canonicalize_url("http://a.com:abc/") is None
+    assert canonicalize_url("http://exa mple.com") is None
+    assert canonicalize_url("http://exa\tmple.com") is None
+    assert canonicalize_url("http://ex$ample.com") is None
+    assert canonicalize_url("-bad.com") is None
+    assert canonicalize_url("mailto:x@y.com") is None
+    assert canonicalize_url("ftp://example.com/file") is None
+    assert canonicalize_url("javascript:alert(1)") is None
+    assert list(blocklist_urls("foo example.com")) == []
+    assert list(blocklist_urls("0.0.0.0 0.0.0.0")) == []
+    assert list(blocklist_urls("127.0.0.1 localhost")) == []
+
+def test_blocklist_hosts_file_lines():
+    """Test 3: Verify hosts-file lines submit every listed domain, not the sink address"""
+    assert list(blocklist_urls("0.0.0.0 example.com")) == ["http://example.com"]
+    assert list(blocklist_urls("127.0.0.1\tads.example.com\n")) == ["http://ads.example.com"]
+    assert list(blocklist_urls("::1 ads.example.com # tracker")) == ["http://ads.example.com"]
+    assert list(blocklist_urls("0.0.0.0 a.com b.com localhost c.com")) == [
+        "http://a.com", "http://b.com", "http://c.com",
+    ]
+    assert list(blocklist_urls("https://Example.com/path # note")) == ["https://example.com/path"]
+
+def test_url_key_deduplicates():
+    """Test 4: Verify canonical duplicates map to the same key"""
+    a = url_key(canonicalize_url("Example.com/"))
+    b = url_key(canonicalize_url("http://example.com"))
+    assert a == b
+    assert len(a) == 16
+    assert url_key("http://other.com") != a
+
+def test_estimate_url_gas_grows_with_length():
+    """Test 5: Verify long URLs are budgeted extra storage gas"""
+    short = estimate_url_gas("http://a.com")
+    long = estimate_url_gas("http://" + "a" * 100 + ".com")
+    assert long > short
+
+def test_checkpoint_rejects_other_contract(tmp_path):
+    """Test 6: Verify a checkpoint cannot be resumed against another deployment"""
+    path = str(tmp_path / "cp.json")
+    Checkpoint(path, CONTRACT).save(42)
+    
+    assert Checkpoint(path, CONTRACT).offset == 42
+    with pytest.raises(Exception) as exc_info:
+        Checkpoint(path, "0xOther")
+    
+    assert "belongs to contract" in str(exc_info.value)
+
+def test_checkpoint_save_is_atomic(tmp_path, monkeypatch):
+    """Test 7: Verify a failed save leaves the previous checkpoint intact"""
+    path = str(tmp_path / "cp.json")
+    checkpoint = Checkpoint(path, CONTRACT)
+    checkpoint.save(10)
+    
+    def crash(src, dst):
+        raise Crash()
+    monkeypatch.setattr(os, "replace", crash)
+    with pytest.raises(Crash):
+        checkpoint.save(20)
+    
+    with open(path) as f:
+        assert json.load(f)["offset"] == 10
+
+def test_submitter_depth_limit(tmp_path):
+    """Test 8: Verify at most `depth` transactions await receipts"""
+    chain = FakeChain()
+    checkpoint = Checkpoint(str(tmp_path / "cp.json"), CONTRACT)
+    submitter = PipelinedSubmitter(chain, ACCOUNT, checkpoint, depth=2, gas_budget=10**9)
+    
+    submitter.send(chunk("http://a.com", start=0))
+    submitter.send(chunk("http://b.com", start=1))
+    assert chain.receipts_waited == 0
+    submitter.send(chunk("http://c.com", start=2))
+    
+    assert chain.receipts_waited == 1
+    assert len(submitter.inflight) == 2
+    assert checkpoint.offset == 1
+
+def test_submitter_splits_over_budget(tmp_path):
+    """Test 9: Verify chunks over the gas budget are split and gas is capped"""
+    chain = FakeChain(gas_per_url=100_000)
+    checkpoint = Checkpoint(str(tmp_path / "cp.json"), CONTRACT)
+    submitter = PipelinedSubmitter(chain, ACCOUNT, checkpoint, depth=4, gas_budget=220_000)
+    
+    submitter.send(chunk("http://a.com", "http://b.com", "http://c.com", "http://d.com"))
+    submitter.drain()
+    
+    assert [urls for urls, _ in chain.sent] == [["http://a.com", "http://b.com"], ["http://c.com", "http://d.com"]]
+    assert all(gas <= 220_000 for _, gas in chain.sent)
+    assert checkpoint.offset == 4
+
+    # A single URL the node estimates over budget is skipped, not sent to revert
+    submitter.gas_budget = 50_000
+    submitter.send(chunk("http://e.com", start=4))
+    submitter.drain()
+    assert len(chain.sent) == 2
+    assert submitter.oversized == 1
+
+def test_checkpoint_only_after_confirmed_receipt(tmp_path):
+    """Test 10: Verify the checkpoint never moves past an unconfirmed or reverted chunk"""
+    chain = FakeChain(revert_tx=1)
+    checkpoint = Checkpoint(str(tmp_path / "cp.json"), CONTRACT)
+    submitter = PipelinedSubmitter(chain, ACCOUNT, checkpoint, depth=4, gas_budget=10**9)
+    
+    submitter.send(chunk("http://a.com", start=0))
+    submitter.send(chunk("http://b.com", start=1))
+    assert checkpoint.offset == 0
+    
+    with pytest.raises(Exception) as exc_info:
+        submitter.drain()
+    
+    assert "reverted" in str(exc_info.value)
+    assert checkpoint.offset == 1
+
+def test_import_resume_never_double_submits(tmp_path):
+    """Test 11: Verify a crash between sending and confirming does not cause resubmission"""
+    blocklist = tmp_path / "blocklist.txt"
+    lines = ["# header", "http://already.com", "0.0.0.0 ads.example.com"]
+    lines += [f"site{i}.com" for i in range(20)] + ["SITE3.com/", "http://site5.com"]
+    blocklist.write_text("\n".join(lines) + "\n")
+    expected = {"http://ads.example.com"} | {f"http://site{i}.com" for i in range(20)}
+    
+    # Every URL gets its own transaction; the process dies waiting for the third receipt
+    chain = FakeChain(proposed=["http://already.com"], crash_on_receipt=3)
+    budget = 150_000  # room for one short URL's estimate, not two
+    with pytest.raises(Crash):
+        import_blocklist(chain, str(blocklist), gas_budget=budget, pipeline=4)
+    
+    checkpoint = Checkpoint(str(blocklist) + ".checkpoint.json", CONTRACT)
+    assert 0 < checkpoint.offset < blocklist.stat().st_size
+    assert len(chain.proposed) - 1 > 2  # more was sent than confirmed
+    
+    chain.crash_on_receipt = None
+    import_blocklist(chain, str(blocklist), gas_budget=budget, pipeline=4)
+    
+    assert sorted(chain.proposed[1:]) == sorted(expected)
+    assert len(chain.proposed) == len(set(chain.proposed))
+    assert Checkpoint(str(blocklist) + ".checkpoint.json", CONTRACT).offset == blocklist.stat().st_size
+    
+    # A third run finds everything on-chain and submits nothing
+    sent_before = len(chain.sent)
+    assert import_blocklist(chain, str(blocklist), gas_budget=budget, pipeline=4)[0] == 0
+    assert len(chain.sent) == sent_before
+
+def test_import_skips_urls_over_gas_budget(tmp_path):
+    """Test 12: Verify a URL too large for one transaction is skipped and later lines still import"""
+    long_url = "http://long.example.com/" + "a" * 20_000
+    budget = 1_000_000
+    assert estimate_url_gas(long_url) > budget
+    blocklist = tmp_path / "blocklist.txt"
+    blocklist.write_text("\n".join(["http://first.com", long_url, "0.0.0.0 second.com third.com"]) + "\n")
+    
+    chain = FakeChain()
+    submitted, duplicates, oversized = import_blocklist(chain, str(blocklist), gas_budget=budget)
+    
+    assert (submitted, duplicates, oversized) == (3, 0, 1)
+    assert chain.proposed == ["http://first.com", "http://second.com", "http://third.com"]
+    assert Checkpoint(str(blocklist) + ".checkpoint.json", CONTRACT).offset == blocklist.stat().st_size
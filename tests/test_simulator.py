@@ -0,0 +1,165 @@
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+from simulator import ReputationDAOSim, Revert, apply, highest_option, random_transactions
+
+ADMIN, ALICE, BOB, CAROL = "0xAdmin", "0xAlice", "0xBob", "0xCarol"
+
+CONTRACT_FUNCTIONS = {
+    "join_dao": "joinDAO",
+    "submit_website": "submitWebsite",
+    "submit_websites": "submitWebsites",
+    "vote": "vote",
+    "process_proposal": "processProposal",
+    "prune_proposal": "pruneProposal",
+}
+
+def make_sim(**policy):
+    sim = ReputationDAOSim(ADMIN, **policy)
+    for name, address in [("Alice", ALICE), ("Bob", BOB), ("Carol", CAROL)]:
+        sim.join_dao(address, name)
+    return sim
+
+def test_majority_rewards():
+    """Test 1: Verify proposer and majority voters are rewarded on finalization"""
+    sim = make_sim()
+    proposal_id = sim.submit_website(ALICE, "http://sim-test.com")
+    sim.vote(ALICE, proposal_id, 0)
+    sim.vote(BOB, proposal_id, 0)
+    sim.vote(CAROL, proposal_id, 3)
+
+    assert sim.process_proposal(ADMIN, proposal_id) == 0
+    assert sim.get_member_info(ALICE)[1] == 100 + 20 + 10
+    assert sim.get_member_info(BOB)[1] == 110
+    assert sim.get_member_info(CAROL)[1] == 100
+
+def test_contract_reverts():
+    """Test 2: Verify rule violations raise the contract's revert messages"""
+    sim = make_sim()
+    proposal_id = sim.submit_website(ALICE, "http://sim-revert.com")
+    sim.vote(BOB, proposal_id, 1)
+
+    for call, message in [
+        (lambda: sim.join_dao(ALICE, "Alice"), "Already a member"),
+        (lambda: sim.vote("0xStranger", proposal_id, 0), "Not a member"),
+        (lambda: sim.vote(BOB, proposal_id, 2), "Already voted"),
+        (lambda: sim.vote(ALICE, proposal_id + 1, 0), "Invalid proposal ID"),
+        (lambda: sim.vote(ALICE, proposal_id, 4), "Invalid option"),
+        (lambda: sim.process_proposal(ADMIN, proposal_id), "Not enough votes to finalize"),
+        (lambda: sim.prune_proposal(ADMIN, proposal_id, 10), "Proposal not processed"),
+    ]:
+        with pytest.raises(Revert) as exc_info:
+            call()
+        assert str(exc_info.value) == message
+
+def test_policy_parameters():
+    """Test 3: Verify threshold, reward and tie-breaking are configurable"""
+    sim = make_sim(vote_threshold=2, reward_amount=5, tie_break=highest_option)
+    proposal_id = sim.submit_website(ALICE, "http://sim-policy.com")
+    sim.vote(BOB, proposal_id, 0)
+    sim.vote(CAROL, proposal_id, 3)
+
+    assert sim.process_proposal(ADMIN, proposal_id) == 3
+    assert sim.get_member_info(ALICE)[1] == 110
+    assert sim.get_member_info(CAROL)[1] == 105
+    assert sim.get_member_info(BOB)[1] == 100
+
+def test_fork_isolates_state():
+    """Test 4: Verify a fork settles the same ballots without touching the original"""
+    sim = make_sim()
+    proposal_id = sim.submit_website(ALICE, "http://sim-fork.com")
+    for voter in (ALICE, BOB, CAROL):
+        sim.vote(voter, proposal_id, 2)
+
+    run = sim.fork(reward_amount=50)
+    run.process_proposal(ADMIN, proposal_id)
+    run.prune_proposal(ADMIN, proposal_id, 10)
+
+    assert run.get_member_info(BOB)[1] == 150
+    with pytest.raises(Revert):
+        run.get_proposal_voters(proposal_id)
+    assert sim.get_member_info(BOB)[1] == 100
+    assert sim.get_proposal_voters(proposal_id) == [ALICE, BOB, CAROL]
+    sim.process_proposal(ADMIN, proposal_id)
+    assert sim.get_member_info(BOB)[1] == 110
+
+def test_negative_arguments_revert_without_state_change():
+    """Test 5: Verify negative ids and options revert like the contract's uint parameters"""
+    sim = make_sim()
+    first = sim.submit_website(ALICE, "http://sim-first.com")
+    second = sim.submit_website(ALICE, "http://sim-second.com")
+    sim.vote(BOB, second, 1)
+
+    for call, message in [
+        (lambda: sim.vote(BOB, second, -1), "Invalid option"),
+        (lambda: sim.vote(BOB, -1, 0), "Invalid proposal ID"),
+        (lambda: sim.process_proposal(ADMIN, -1), "Invalid proposal ID"),
+        (lambda: sim.prune_proposal(ADMIN, -1, 10), "Invalid proposal ID"),
+        (lambda: sim.get_proposal_voters(-1), "Invalid proposal ID"),
+        (lambda: sim.get_proposal_voters(second + 1), "Invalid proposal ID"),
+        (lambda: sim.get_proposal_votes(-1), "Invalid proposal ID"),
+        (lambda: sim.get_proposal_votes(second + 1), "Invalid proposal ID"),
+    ]:
+        with pytest.raises(Revert) as exc_info:
+            call()
+        assert str(exc_info.value) == message
+
+    assert sim.get_proposal_votes(first) == (0, 0, 0, 0)
+    assert sim.get_proposal_votes(second) == (0, 1, 0, 0)
+    assert sim.get_proposal_voters(second) == [BOB]
+    assert sim.get_member_info(BOB)[4] == 1
+
+# Differential tests against the real contract (require Ganache; fixtures in conftest.py)
+def apply_contract(w3, contract, tx):
+    method, sender, *args = tx
+    fn = getattr(contract.functions, CONTRACT_FUNCTIONS[method])
+    try:
+        tx_hash = fn(*args).transact({"from": sender})
+        w3.eth.wait_for_transaction_receipt(tx_hash)
+    except Exception as e:
+        return str(e)
+    return None
+
+def assert_same_state(contract, sim, accounts):
+    assert contract.functions.proposalCount().call() == sim.proposal_count
+    assert contract.functions.totalMembers().call() == sim.total_members
+
+    for account in accounts:
+        info = contract.functions.getMemberInfo(account).call()
+        expected = sim.get_member_info(account)
+        assert (info[0], info[1], info[2], info[4], info[5], info[6]) == expected, account
+
+    for proposal_id in range(sim.proposal_count):
+        p = contract.functions.proposals(proposal_id).call()
+        assert p[1] == sim.urls[proposal_id]
+        assert p[2] == sim.member_address[sim.proposer[proposal_id]]
+        assert (p[4], p[5], p[6]) == (
+            bool(sim.processed[proposal_id]), bool(sim.active[proposal_id]), sim.final_status[proposal_id]
+        )
+        assert tuple(contract.functions.getProposalVotes(proposal_id).call()) == sim.get_proposal_votes(proposal_id)
+        assert contract.functions.pruneStarted(proposal_id).call() == bool(sim.prune_started[proposal_id])
+        assert contract.functions.proposalPruned(proposal_id).call() == bool(sim.pruned[proposal_id])
+        if not sim.prune_started[proposal_id]:
+            assert contract.functions.getProposalVoters(proposal_id).call() == sim.get_proposal_voters(proposal_id)
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_differential_random_sequence(w3, deploy_contract, seed):
+    """Test 6: Verify the simulator matches the contract on random transaction sequences"""
+    contract = deploy_contract()
+    accounts = w3.eth.accounts
+    sim = ReputationDAOSim(accounts[0])
+
+    for tx in random_transactions(random.Random(seed), accounts, 150):
+        expected = apply(sim, tx)
+        actual = apply_contract(w3, contract, tx)
+        if expected is None:
+            assert actual is None, f"{tx} reverted on-chain: {actual}"
+        else:
+            assert actual is not None and expected in actual, f"{tx}: expected revert '{expected}', got {actual}"
+
+    assert_same_state(contract, sim, accounts)